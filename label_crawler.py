@@ -21,19 +21,45 @@ Notes:
   - Skips rows when pdffile is missing/blank.
   - Skips PDFs that fail a basic "quality" check (configurable).
   - Skips PDFs that error/403/etc. (does not include them in output).
+  - Skips rows whose registration number was already seen earlier in the
+    CSV, and rows whose label PDF another row already settled. A shared
+    label appears once, under the title of whichever row resolved it first
+    (timing- and cache-dependent, so not necessarily the first CSV row).
+  - Caches ORDS JSON and PDFs on disk, so re-runs and restarts after a
+    crash mostly skip the network.
+  - Records are streamed to a JSONL checkpoint as they are added (in
+    completion order, not CSV order); the JSON array above is assembled
+    from it at the end, so the crawl is never held in memory.
 """
 
+import asyncio
 import csv
-import io
+import hashlib
 import json
+import logging
 import os
 import re
+import string
 import sys
+import tempfile
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
 
-import requests
-from pdfminer.high_level import extract_text
+import httpx
+import orjson
+import pypdfium2 as pdfium
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+
+try:
+    import uvloop  # libuv-backed event loop; cheaper per-request I/O dispatch
+except ImportError:  # Windows, or not installed: fall back to the stdlib loop
+    uvloop = None
+
+log = logging.getLogger("label_crawler")
 
 # -----------------------------
 # Config
@@ -52,6 +78,8 @@ page_limit: Optional[int] = 10  # e.g. 50 for testing, or None for full crawl
 # Networking
 REQUEST_TIMEOUT = 10  # seconds (per request)
 PDF_DOWNLOAD_TIMEOUT = 20  # seconds
+MAX_CONCURRENCY = 16  # rows in flight at once (ORDS lookup + PDF download)
+DOWNLOAD_CHUNK_BYTES = 65_536  # read size while streaming PDF bodies
 
 # Quality checks (tune as needed)
 MIN_PDF_BYTES = 20_000          # skip tiny PDFs
@@ -59,35 +87,101 @@ MAX_PDF_BYTES = 40_000_000      # safety cap (40MB) - skip huge PDFs
 QUALITY_CHECK_PAGES = 2         # how many pages to sample for text extraction
 MIN_EXTRACTED_CHARS = 400       # if extracted text chars < this -> likely poor/scanned/unreadable
 MIN_ALPHA_RATIO = 0.35          # proportion of alphabetic chars in extracted text
+MIN_PAGE1_CHARS = 50            # fewer text-layer chars on page 1 -> image-only scan
+
+# On-disk cache of fetched ORDS JSON and PDFs, keyed by URL hash
+CACHE_DIR = ".epa_cache"
+JSON_CACHE_MAX_AGE = 7 * 86400  # seconds; PDFs are kept until deleted
 
 # Output
 OUTPUT_JSON = "epa_ppls_labels.json"
+RESULTS_JSONL = "results.jsonl"  # checkpoint, one record per line as they're added
+MAX_TEXT_CHARS = 500_000  # consumers only use the start of a label; truncate beyond this
+
+# PDF parsing (CPU-bound; PDFium is not thread-safe, so use processes)
+PDF_WORKERS = os.cpu_count() or 1
 
 
 # -----------------------------
 # Helpers
 # -----------------------------
 
+# Text normalization patterns, compiled once
+_WS = re.compile(r"\s+")
+_NL3 = re.compile(r"\n{3,}")
+
+# Every byte except ASCII letters, for bytes.translate(None, delete=...)
+_ASCII_NON_ALPHA = bytes(b for b in range(256) if chr(b) not in string.ascii_letters)
+
+
 def clean_product_name(name: str) -> str:
     # Normalize whitespace for nicer titles
-    return re.sub(r"\s+", " ", (name or "").strip())
+    return _WS.sub(" ", (name or "").strip())
 
 
-def build_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update({"User-Agent": USER_AGENT})
-    return s
+def build_client() -> httpx.AsyncClient:
+    # HTTP/2 multiplexes every request to a host over one connection, so the
+    # TLS handshake to ordspub/www3 is paid once per crawl, not per row
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT},
+        timeout=httpx.Timeout(REQUEST_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        follow_redirects=True,
+    )
+
+
+def cache_path(kind: str, url: str) -> str:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, kind, f"{key}.{kind}")
+
+
+def cache_read(path: str, max_age: Optional[float] = None) -> Optional[bytes]:
+    """
+    Cached bytes at path, or None if missing or older than max_age seconds.
+    """
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
 
+def cache_write(path: str, data: bytes) -> None:
+    """
+    Write via a temp file + os.replace so a crash never leaves a torn entry.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("[warn] cache write failed: %s -> %s", path, e)
+
+
+async def safe_get_json(client: httpx.AsyncClient, url: str) -> Optional[dict]:
+    path = cache_path("json", url)
+    cached = cache_read(path, max_age=JSON_CACHE_MAX_AGE)
+    if cached is not None:
+        try:
+            return json.loads(cached)
+        except ValueError:
+            pass  # corrupt entry; refetch below
 
-def safe_get_json(session: requests.Session, url: str) -> Optional[dict]:
     try:
-        r = session.get(url, timeout=REQUEST_TIMEOUT)
+        r = await client.get(url)
         if r.status_code != 200:
-            print(f"  [skip] JSON fetch failed {r.status_code}: {url}")
+            log.debug("[skip] JSON fetch failed %s: %s", r.status_code, url)
             return None
-        return r.json()
+        payload = r.json()
+        cache_write(path, r.content)
+        return payload
     except Exception as e:
-        print(f"  [skip] JSON error: {url} -> {e}")
+        log.debug("[skip] JSON error: %s -> %s", url, e)
         return None
 
 
@@ -97,6 +191,15 @@ def extract_pdffile(payload: dict) -> Optional[str]:
       {"items":[{"pdffiles":[{"pdffile":"....pdf"}]}]}
     But be defensive and handle a few variants.
     """
+    # Fast path: try the canonical shape directly and only fall back to the
+    # defensive walk below if it isn't there
+    try:
+        fname = payload["items"][0]["pdffiles"][0]["pdffile"].strip()
+        if fname:
+            return fname
+    except (KeyError, TypeError, IndexError, AttributeError):
+        pass
+
     if not isinstance(payload, dict):
         return None
 
@@ -128,60 +231,110 @@ def extract_pdffile(payload: dict) -> Optional[str]:
     return None
 
 
-def head_content_length(session: requests.Session, url: str) -> Optional[int]:
+async def download_pdf(client: httpx.AsyncClient, url: str, dest: str) -> bool:
+    """
+    Stream the PDF body straight to dest (the cache file). Size bounds are
+    checked against Content-Length before reading the body, and again as
+    the body grows, since the server doesn't always send the header. The
+    body is never held in memory as a whole; workers open the file by path.
+
+    Written via a temp file + os.replace, like cache_write().
+    Returns True if dest now holds the PDF.
+    """
+    tmp = None
     try:
-        r = session.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
-        if r.status_code >= 400:
-            return None
-        cl = r.headers.get("Content-Length")
-        if cl is None:
-            return None
-        return int(cl)
-    except Exception:
-        return None
+        async with client.stream("GET", url, timeout=PDF_DOWNLOAD_TIMEOUT) as r:
+            if r.status_code != 200:
+                log.debug("[skip] PDF fetch failed %s: %s", r.status_code, url)
+                return False
+
+            # Error pages sometimes come back as 200 text/html; don't download those
+            ctype = r.headers.get("Content-Type", "").lower()
+            if ctype and "pdf" not in ctype and "octet-stream" not in ctype:
+                log.debug("[skip] PDF fetch not a PDF (%s): %s", ctype, url)
+                return False
+
+            cl = r.headers.get("Content-Length")
+            if cl is not None and cl.isdigit():
+                if int(cl) < MIN_PDF_BYTES:
+                    log.debug("[skip] Content-Length says too small: %s bytes: %s", cl, url)
+                    return False
+                if int(cl) > MAX_PDF_BYTES:
+                    log.debug("[skip] Content-Length says too large: %s bytes: %s", cl, url)
+                    return False
+
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".tmp")
+            nbytes = 0
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in r.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                    nbytes += len(chunk)
+                    if nbytes > MAX_PDF_BYTES:
+                        log.debug("[skip] PDF exceeds %s bytes mid-download: %s", MAX_PDF_BYTES, url)
+                        return False
+                    f.write(chunk)
+        os.replace(tmp, dest)
+        tmp = None
+        return True
+    except Exception as e:
+        log.debug("[skip] PDF download error: %s -> %s", url, e)
+        return False
+    finally:
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
 
 
-def download_pdf(session: requests.Session, url: str) -> Optional[bytes]:
+def page_text(pdf: pdfium.PdfDocument, index: int) -> str:
+    """
+    Text of a single page, releasing the PDFium page handles afterwards.
+    """
+    page = pdf[index]
+    textpage = page.get_textpage()
     try:
-        r = session.get(url, timeout=PDF_DOWNLOAD_TIMEOUT)
-        if r.status_code != 200:
-            print(f"  [skip] PDF fetch failed {r.status_code}: {url}")
-            return None
-        return r.content
-    except Exception as e:
-        print(f"  [skip] PDF download error: {url} -> {e}")
-        return None
+        return textpage.get_text_bounded() or ""
+    finally:
+        textpage.close()
+        page.close()
 
 
-def quality_check_pdf(pdf_bytes: bytes) -> Tuple[bool, str]:
+def is_born_digital(first_page_text: str) -> bool:
     """
-    Fast, pragmatic quality check:
-      - size bounds
-      - sample extracted text from first N pages
-      - require minimum extracted characters and a minimum alpha ratio
+    Cheap probe: does page 1 carry a real text layer?
+    Scanned labels are just images, so their page text is (nearly) empty.
+    Judged from the page-1 text the gate samples anyway, so PDFium's text
+    analysis (the expensive part of get_textpage()) runs once per page.
+    """
+    return len(first_page_text) > MIN_PAGE1_CHARS
 
-    Returns (ok, reason).
+
+def count_alpha(text: str) -> int:
     """
-    nbytes = len(pdf_bytes)
-    if nbytes < MIN_PDF_BYTES:
-        return False, f"too_small_bytes={nbytes}"
-    if nbytes > MAX_PDF_BYTES:
-        return False, f"too_large_bytes={nbytes}"
+    Same as sum(c.isalpha() for c in text), but label text is almost always
+    ASCII, where deleting the non-letters with bytes.translate is a single
+    C pass instead of a Python-level call per character.
+    """
+    if text.isascii():
+        return len(text.encode("ascii").translate(None, _ASCII_NON_ALPHA))
+    return sum(map(str.isalpha, text))
 
-    try:
-        # pdfminer can read from a file-like object
-        with io.BytesIO(pdf_bytes) as bio:
-            text = extract_text(bio, maxpages=QUALITY_CHECK_PAGES) or ""
-    except Exception as e:
-        return False, f"pdf_text_extract_failed={e}"
 
+def judge_quality(sample: str) -> Tuple[bool, str]:
+    """
+    Text metrics on the sampled first pages: require a minimum number of
+    extracted characters and a minimum alpha ratio.
+
+    Returns (ok, reason).
+    """
     # Normalize and measure
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS.sub(" ", sample).strip()
     if not text:
         return False, "no_text_extracted"
 
     chars = len(text)
-    alpha = sum(1 for c in text if c.isalpha())
+    alpha = count_alpha(text)
     alpha_ratio = (alpha / chars) if chars else 0.0
 
     if chars < MIN_EXTRACTED_CHARS:
@@ -192,122 +345,374 @@ def quality_check_pdf(pdf_bytes: bytes) -> Tuple[bool, str]:
     return True, "ok"
 
 
-def extract_full_text(pdf_bytes: bytes) -> str:
+def clean_text(txt: str) -> str:
+    # Light cleanup; keep newlines reasonably. Most short labels have no
+    # stray \r or blank-line runs once \r\n is folded, so check with a C
+    # substring search before paying for another full pass over the text.
+    txt = txt.replace("\r\n", "\n")
+    if "\r" in txt:
+        txt = txt.replace("\r", "\n")
+    if "\n\n\n" in txt:
+        txt = _NL3.sub("\n\n", txt)
+    return txt.strip()
+
+
+def quality_and_extract(pdf_path: str) -> Tuple[bool, str, str]:
     """
-    Full PDF text extraction. If this fails, returns empty string.
+    Fast, pragmatic quality check and full text extraction in one pass over
+    the PDF at pdf_path (one unit of work for a process-pool worker; only
+    the path crosses the process boundary, PDFium reads the file itself):
+      - size bounds
+      - reject image-only scans before extracting anything
+      - extract the first N pages and judge_quality() them
+      - only if that passes, extract the remaining pages; the sampled
+        pages are reused rather than parsed twice
+      - stop reading pages once MAX_TEXT_CHARS is reached and truncate
+
+    Keep this to a single PdfDocument per PDF: PDFium caches decoded fonts
+    and CMaps per document, so every page (gate sample and output alike)
+    reuses them. Opening the file again per phase would throw that away.
+
+    Returns (ok, reason, text); text is "" unless ok.
     """
     try:
-        with io.BytesIO(pdf_bytes) as bio:
-            txt = extract_text(bio) or ""
-        # Light cleanup; keep newlines reasonably
-        txt = txt.replace("\r\n", "\n").replace("\r", "\n")
-        txt = re.sub(r"\n{3,}", "\n\n", txt)
-        return txt.strip()
-    except Exception:
-        return ""
+        nbytes = os.path.getsize(pdf_path)
+    except OSError as e:
+        return False, f"pdf_missing={e}", ""
+    if nbytes < MIN_PDF_BYTES:
+        return False, f"too_small_bytes={nbytes}", ""
+    if nbytes > MAX_PDF_BYTES:
+        return False, f"too_large_bytes={nbytes}", ""
+
+    pdf = None
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+        npages = len(pdf)
+        pages = [page_text(pdf, 0)] if npages else []
+        if not pages or not is_born_digital(pages[0]):
+            return False, "scanned_image_only", ""
+
+        pages.extend(page_text(pdf, i) for i in range(1, min(QUALITY_CHECK_PAGES, npages)))
+        ok, reason = judge_quality(" ".join(pages))
+        if not ok:
+            return False, reason, ""
+
+        truncated = False
+        nchars = sum(map(len, pages))
+        for i in range(len(pages), npages):
+            if nchars > MAX_TEXT_CHARS:
+                truncated = True
+                break
+            pages.append(page_text(pdf, i))
+            nchars += len(pages[-1])
+    except Exception as e:
+        return False, f"pdf_text_extract_failed={e}", ""
+    finally:
+        if pdf is not None:
+            pdf.close()
+
+    text = clean_text("\n".join(pages))
+    if truncated or len(text) > MAX_TEXT_CHARS:
+        text = text[:MAX_TEXT_CHARS] + "\n...[truncated]"
+    return True, reason, text
+
+
+class PdfWorkers:
+    """
+    The PDF process pool, rebuilt when a worker dies. A PDFium segfault or
+    an OOM kill leaves a ProcessPoolExecutor permanently broken (every later
+    submit raises BrokenProcessPool), so without this one bad PDF would
+    quietly cost every remaining label in the crawl.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self.pool = ProcessPoolExecutor(max_workers=max_workers)
+        # Caps the one-off retry processes spawned after a breakage
+        self.retry_slots = asyncio.Semaphore(max_workers)
+
+    def __enter__(self) -> "PdfWorkers":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.pool.shutdown()
+
+    async def run(self, fn, *args):
+        """
+        Run fn(*args) in the pool. If the pool breaks, rebuild it and retry
+        once in a throwaway single-worker process: a breakage fails every
+        queued task, not just the culprit, and retrying them together on the
+        new pool would let the culprit break it again. Isolated, only the PDF
+        that actually kills workers raises BrokenProcessPool to the caller.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # Every queued task sees the same breakage; only the first one to
+            # get here swaps in a fresh pool for the rest of the crawl
+            if self.pool is pool:
+                log.warning("[warn] PDF worker died; restarting the process pool")
+                pool.shutdown(wait=False, cancel_futures=True)
+                self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+        async with self.retry_slots:
+            solo = ProcessPoolExecutor(max_workers=1)
+            try:
+                return await loop.run_in_executor(solo, fn, *args)
+            finally:
+                solo.shutdown(wait=False)
 
 
 # -----------------------------
 # Main crawl
 # -----------------------------
 
-def main() -> None:
-    if not os.path.exists(CSV_FILENAME):
-        print(f"[error] CSV not found: {CSV_FILENAME}")
-        sys.exit(1)
+async def process_row(
+    client: httpx.AsyncClient,
+    workers: PdfWorkers,
+    net_slots: asyncio.Semaphore,
+    pdf_locks: Dict[str, asyncio.Lock],
+    seen_pdfs: Dict[str, str],
+    idx: int,
+    reg: str,
+    product_name: str,
+) -> Optional[Dict]:
+    """
+    Run one CSV row through ORDS -> PDF -> quality gate -> text.
+    net_slots is held only around requests to the EPA hosts; parsing is
+    bounded by the worker pool's own queue, so rows waiting on a CPU don't
+    hold up downloads.
+    pdf_locks serializes rows sharing a pdffile; seen_pdfs maps each
+    pdffile already settled (added, or rejected by the quality gate) to the
+    reg that settled it.
+    Returns the output record, or None if the row was skipped.
+    """
+    reg = reg.strip()
+    product_name = clean_product_name(product_name)
 
-    session = build_session()
+    log.debug("[%d] reg=%s name=%s", idx, reg, product_name[:80])
+    if not reg:
+        log.debug("[skip] [%d] missing epa_registration_number", idx)
+        return None
 
-    results: List[Dict] = []
-    processed = 0
-    added = 0
-    skipped = 0
+    # 1) Fetch ORDS JSON
+    ords_url = f"{EPA_PPLS_JSON_BASE}{reg}"
+    async with net_slots:
+        payload = await safe_get_json(client, ords_url)
+    if not payload:
+        return None
 
-    with open(CSV_FILENAME, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if page_limit is not None and processed >= page_limit:
-                break
+    pdffile = extract_pdffile(payload)
+    if not pdffile:
+        log.debug("[skip] reg=%s pdffile empty", reg)
+        return None
 
-            processed += 1
-            reg = (row.get("epa_registration_number") or "").strip()
-            product_name = clean_product_name(row.get("product_name") or "")
+    # Product families often share one label PDF. Rows sharing it take turns;
+    # once one settles it the rest skip. A download or worker failure leaves
+    # it unsettled, so the next sibling row tries again (as before dedupe).
+    pdf_url = f"{EPA_PDF_BASE}{pdffile}"
+    async with pdf_locks[pdffile]:
+        if pdffile in seen_pdfs:
+            log.debug("[skip] reg=%s same pdffile as reg=%s: %s", reg, seen_pdfs[pdffile], pdffile)
+            return None
+        text, settled = await fetch_label_text(client, workers, net_slots, reg, pdf_url)
+        if settled:
+            seen_pdfs[pdffile] = reg
+    if not text:
+        return None
 
-            print(f"\n[{processed}] reg={reg} name={product_name[:80]}")
-            if not reg:
-                print("  [skip] missing epa_registration_number")
-                skipped += 1
-                continue
+    # 7) Build output record (ExtensionBot format)
+    record = {
+        "title": product_name or reg,
+        "link": pdf_url,
+        "epa_registration_number": reg,
+        "state": "NA",
+        "content": [
+            {"content_text": text}
+        ],
+    }
+    log.info("[added] reg=%s %s", reg, product_name[:80])
+    return record
+
+
+async def fetch_label_text(
+    client: httpx.AsyncClient,
+    workers: PdfWorkers,
+    net_slots: asyncio.Semaphore,
+    reg: str,
+    pdf_url: str,
+) -> Tuple[Optional[str], bool]:
+    """
+    Steps 2-6 of process_row: get the label PDF and its text.
+    Returns (text, settled). text is None if the label is skipped; settled
+    is False only for failures worth retrying from another row (download
+    error, worker error), True once the PDF itself has been judged.
+    """
+    # 2) PDF URL
+    log.debug("reg=%s pdf: %s", reg, pdf_url)
+
+    # 3) Reuse the PDF from an earlier run if we have it
+    pdf_path = cache_path("pdf", pdf_url)
+    if not os.path.exists(pdf_path):
+        # 4) Download PDF into the cache (size-bounded while streaming)
+        async with net_slots:
+            downloaded = await download_pdf(client, pdf_url, pdf_path)
+        if not downloaded:
+            return None, False
+
+    # 5) + 6) Quality gate and full text, in a worker process so other
+    # rows keep downloading while this one is parsed
+    try:
+        ok, reason, text = await workers.run(quality_and_extract, pdf_path)
+    except BrokenProcessPool:
+        log.warning("[skip] reg=%s PDF worker died on this PDF (retried alone): %s", reg, pdf_path)
+        return None, False
+    except Exception as e:
+        log.warning("[skip] reg=%s PDF worker error: %s", reg, e)
+        return None, False
+    if not ok:
+        log.debug("[skip] reg=%s quality_check failed: %s", reg, reason)
+        return None, True
+    if not text:
+        log.debug("[skip] reg=%s extracted empty text after passing quality (rare)", reg)
+        return None, True
+    return text, True
 
-            # 1) Fetch ORDS JSON
-            ords_url = f"{EPA_PPLS_JSON_BASE}{reg}"
-            payload = safe_get_json(session, ords_url)
-            if not payload:
-                skipped += 1
-                continue
 
-            pdffile = extract_pdffile(payload)
-            if not pdffile:
-                print("  [skip] pdffile empty")
-                skipped += 1
+def write_json_array(jsonl_path: str, out_path: str) -> None:
+    """
+    Wrap the JSONL checkpoint into the JSON array ExtensionBot expects.
+    Each line is already a serialized record, so this is a byte copy:
+    nothing is parsed and only one record is in memory at a time.
+    """
+    with open(jsonl_path, "rb") as src, open(out_path, "wb") as out:
+        out.write(b"[")
+        sep = b"\n"
+        for line in src:
+            line = line.rstrip(b"\n")
+            if not line:
                 continue
+            out.write(sep)
+            out.write(line)
+            sep = b",\n"
+        out.write(b"\n]\n")
 
-            # 2) Build PDF URL
-            pdf_url = f"{EPA_PDF_BASE}{pdffile}"
-            print(f"  pdf: {pdf_url}")
-
-            # 3) (Optional) HEAD size check first
-            cl = head_content_length(session, pdf_url)
-            if cl is not None:
-                if cl < MIN_PDF_BYTES:
-                    print(f"  [skip] HEAD says too small: {cl} bytes")
-                    skipped += 1
-                    continue
-                if cl > MAX_PDF_BYTES:
-                    print(f"  [skip] HEAD says too large: {cl} bytes")
-                    skipped += 1
-                    continue
-
-            # 4) Download PDF
-            pdf_bytes = download_pdf(session, pdf_url)
-            if not pdf_bytes:
-                skipped += 1
-                continue
 
-            # 5) Quality gate
-            ok, reason = quality_check_pdf(pdf_bytes)
-            if not ok:
-                print(f"  [skip] quality_check failed: {reason}")
-                skipped += 1
-                continue
+def count_csv_rows(path: str) -> int:
+    """
+    Data rows in the CSV, for the progress bar's total/ETA only (a raw line
+    count; quoted multi-line fields would overcount slightly). Blank lines
+    are left out, matching the rows crawl() skips.
+    """
+    with open(path, "rb") as f:
+        return max(sum(1 for line in f if line.strip(b"\r\n")) - 1, 0)
 
-            # 6) Extract full text
-            text = extract_full_text(pdf_bytes)
-            if not text:
-                print("  [skip] extracted empty text after passing quality (rare)")
-                skipped += 1
-                continue
 
-            # 7) Build output record (ExtensionBot format)
-            record = {
-                "title": product_name or reg,
-                "link": pdf_url,
-                "epa_registration_number": reg,
-                "state": "NA",
-                "content": [
-                    {"content_text": text}
-                ],
-            }
-            results.append(record)
-            added += 1
-            print(f"  [added] total_added={added}")
-
-            # Polite pacing helps reduce upstream throttling in large runs
-            time.sleep(0.1)
+def read_csv_columns(path: str) -> Tuple[int, int]:
+    """
+    Indices of the epa_registration_number and product_name columns in the
+    CSV header. Raises ValueError if either is missing.
+    """
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    return header.index("epa_registration_number"), header.index("product_name")
+
+
+async def crawl(ireg: int, iname: int) -> Tuple[int, int]:
+    """
+    Fan the CSV rows out over a bounded number of concurrent workers,
+    streaming each added record to RESULTS_JSONL. ireg/iname are the
+    column indices from read_csv_columns().
+    Returns (rows processed, records added).
+    """
+    # The semaphore doubles as polite pacing: never more than
+    # MAX_CONCURRENCY requests in flight against the EPA hosts.
+    net_slots = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    processed = 0
+    added = 0
+    seen_regs = set()
+    pdf_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+    seen_pdfs: Dict[str, str] = {}
+
+    total = count_csv_rows(CSV_FILENAME)
+    if page_limit is not None:
+        total = min(total, page_limit)
+
+    with PdfWorkers(PDF_WORKERS) as workers, \
+            open(RESULTS_JSONL, "wb") as checkpoint, \
+            tqdm(total=total, unit="row") as progress:
+
+        async def run_row(client: httpx.AsyncClient, idx: int, reg: str, name: str) -> None:
+            nonlocal added
+            try:
+                record = await process_row(
+                    client, workers, net_slots, pdf_locks, seen_pdfs, idx, reg, name
+                )
+                if record is not None:
+                    # Flushed per record so a crashed/interrupted crawl keeps its work;
+                    # the record (and its text) is dropped as soon as it's written
+                    checkpoint.write(orjson.dumps(record) + b"\n")
+                    checkpoint.flush()
+                    added += 1
+            finally:
+                progress.update()
+
+        async with build_client() as client:
+            with open(CSV_FILENAME, "r", newline="", encoding="utf-8") as f:
+                # Plain csv.reader + fixed column indices: no dict per row
+                reader = csv.reader(f)
+                next(reader, None)  # header, already checked in main()
+
+                async with asyncio.TaskGroup() as tg:
+                    for row in reader:
+                        # DictReader skipped blank lines; csv.reader yields [] for them
+                        if not row:
+                            continue
+                        if page_limit is not None and processed >= page_limit:
+                            break
+                        processed += 1
+                        # Short (ragged) rows count as blank fields, like DictReader did
+                        reg = row[ireg] if ireg < len(row) else ""
+                        name = row[iname] if iname < len(row) else ""
+
+                        # Repeated registration numbers resolve to the same label
+                        key = reg.strip()
+                        if key and key in seen_regs:
+                            log.debug("[%d] [skip] duplicate reg=%s", processed, key)
+                            progress.update()
+                            continue
+                        seen_regs.add(key)
+
+                        tg.create_task(run_row(client, processed, reg, name))
+
+    return processed, added
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    if not os.path.exists(CSV_FILENAME):
+        log.error("[error] CSV not found: %s", CSV_FILENAME)
+        sys.exit(1)
+
+    # Checked before crawl() truncates the previous run's checkpoint
+    try:
+        ireg, iname = read_csv_columns(CSV_FILENAME)
+    except ValueError as e:
+        log.error("[error] CSV header: %s", e)
+        sys.exit(1)
+
+    # Route log lines through tqdm.write so they don't tear the progress bar
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with logging_redirect_tqdm(), asyncio.Runner(loop_factory=loop_factory) as runner:
+        processed, added = runner.run(crawl(ireg, iname))
+    skipped = processed - added
 
     # Write JSON
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as out:
-        json.dump(results, out, ensure_ascii=False, indent=2)
+    write_json_array(RESULTS_JSONL, OUTPUT_JSON)
 
     print("\n====================")
     print("Crawl complete")